@@ -1,17 +1,78 @@
+import os
+import sys
+import numpy as np
 import pandas as pd
-from typing import Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from onedatareport.analysis.trend import analyze_trend_changes, detect_new_categorical_values
+if TYPE_CHECKING:
+    import polars as pl
+
+from onedatareport.analysis.trend import analyze_trend_changes, analyze_trend_values, detect_new_categorical_values
 from onedatareport.config.analysis import ColumnAnalysisConfig, ColumnsAnalysisConfig
-from onedatareport.data_handling.columnar_dataframe import ColumnarDataFrame
+from onedatareport.data_handling.columnar_dataframe import ColumnarDataFrame, read_column_source
 from onedatareport.utils.profiling import run_ydata_profiling_report
 
 
-def process_column(
+def _analyze_timeseries_column(
     original_df: pd.DataFrame,
     new_df: pd.DataFrame,
     config: ColumnAnalysisConfig
-) -> pd.DataFrame:
+) -> Dict[str, Any]:
+    """Run the trend-change analysis for a timeseries column."""
+    return analyze_trend_changes(
+        original_df, new_df, config.column_name, config.time_column, config.period
+    )
+
+def _analyze_categorical_column(
+    original_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    config: ColumnAnalysisConfig
+) -> Dict[str, Any]:
+    """Run the new-value detection for a categorical column."""
+    return detect_new_categorical_values(original_df, new_df, config.column_name)
+
+# Per-type dispatch table: resolving the analysis function is a single dict
+# lookup instead of a branch chain re-evaluated for every column.
+_TYPE_HANDLERS = {
+    "timeseries": _analyze_timeseries_column,
+    "categorical": _analyze_categorical_column,
+}
+
+def _profile_sortby(df: pd.DataFrame, time_column: Optional[str]) -> Optional[str]:
+    """
+    Return the time column only when the profiler can actually sort by it.
+
+    In tsmode ydata-profiling sets the sortby column as the frame index and
+    its gap statistics diff that index, which raises on string columns (e.g.
+    CSV dates read without parsing). Such columns are left unsorted, matching
+    the per-column profiling behavior.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame about to be profiled.
+    time_column : Optional[str]
+        The configured time column, if any.
+
+    Returns
+    -------
+    Optional[str]
+        The time column when it is datetime or numeric, otherwise None.
+    """
+    if time_column is None or time_column not in df.columns:
+        return None
+    series = df[time_column]
+    if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return time_column
+    return None
+
+def process_column(
+    original_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    config: ColumnAnalysisConfig,
+    profile_row: Optional[pd.Series] = None
+) -> Dict[str, Any]:
     """
     Process a single column and generate analysis for that column.
 
@@ -23,28 +84,144 @@ def process_column(
         The new data to be analyzed.
     config : ColumnAnalysisConfig
         Configuration for analyzing the column.
+    profile_row : Optional[pd.Series], optional
+        The column's row from a profiling report computed over the full
+        DataFrame. When provided, per-column profiling is skipped; an empty
+        Series means the column had no profile entry.
 
     Returns
     -------
-    pd.DataFrame
-        A DataFrame containing the results of the analysis for the column.
+    Dict[str, Any]
+        A dictionary containing the results of the analysis for the column.
     """
     result = {'column_name': config.column_name}
     column_type = config.type_schema[config.column_name]
 
-    if column_type == "timeseries":
-        trend_changes = analyze_trend_changes(original_df, new_df, config.column_name, config.time_column, config.period)
-        result.update(trend_changes)
+    handler = _TYPE_HANDLERS.get(column_type)
+    if handler is not None:
+        result.update(handler(original_df, new_df, config))
+
+    if profile_row is None:
+        profile_data = run_ydata_profiling_report(new_df[[config.column_name]], {config.column_name: column_type})
+        if not profile_data.empty:
+            result.update(profile_data.iloc[0].to_dict())
+    elif len(profile_row):
+        result.update(profile_row.to_dict())
 
-    elif column_type == "categorical":
-        new_values = detect_new_categorical_values(original_df, new_df, config.column_name)
-        result.update(new_values)
+    return result
 
-    profile_data = run_ydata_profiling_report(new_df[[config.column_name]], {config.column_name: column_type})
-    if not profile_data.empty:
-        result.update(profile_data.iloc[0].to_dict())
+def _process_column_from_sources(
+    original_source: Union[tuple, pd.DataFrame],
+    new_source: Union[tuple, pd.DataFrame],
+    config: ColumnAnalysisConfig
+) -> Dict[str, Any]:
+    """
+    Worker entry point that loads a single column from its source and processes it.
 
-    return pd.DataFrame([result])
+    Reading the on-disk column sources directly in the worker avoids sharing
+    the mutable in-memory state of a ColumnarDataFrame across processes; a
+    memory-resident side ships its column slice instead of a source triple.
+
+    Parameters
+    ----------
+    original_source : Union[tuple, pd.DataFrame]
+        Source triple for the original column, as returned by
+        `ColumnarDataFrame.column_source`, or the resident column slice.
+    new_source : Union[tuple, pd.DataFrame]
+        Source triple for the new column, or the resident column slice.
+    config : ColumnAnalysisConfig
+        Configuration for analyzing the column.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary containing the results of the analysis for the column.
+    """
+    original_column_df = read_column_source(original_source) if isinstance(original_source, tuple) else original_source
+    new_column_df = read_column_source(new_source) if isinstance(new_source, tuple) else new_source
+    return process_column(original_column_df, new_column_df, config)
+
+def _process_columns_polars(
+    original_df: 'pl.DataFrame',
+    new_df: 'pl.DataFrame',
+    columns_config: ColumnsAnalysisConfig
+) -> pd.DataFrame:
+    """
+    Process columns of polars DataFrames without converting the data to pandas first.
+
+    Categorical uniques for every column are gathered in a single select per
+    frame — polars evaluates the per-column expressions in parallel on Arrow
+    memory — and trend columns feed their raw value arrays straight into the
+    decomposition.
+
+    Parameters
+    ----------
+    original_df : pl.DataFrame
+        The original dataset before new data is inserted.
+    new_df : pl.DataFrame
+        The new data to be analyzed.
+    columns_config : ColumnsAnalysisConfig
+        Configuration object for analyzing multiple columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the accumulated results for all columns.
+    """
+    import polars as pl
+
+    type_schema = columns_config.type_schema
+    columns = [col for col in original_df.columns if col != columns_config.time_column]
+    categorical_columns = [col for col in columns if type_schema.get(col) == "categorical"]
+
+    original_uniques = {}
+    new_uniques = {}
+    if categorical_columns:
+        # One collect per frame; the per-column unique() expressions run in
+        # parallel inside the polars engine.
+        original_row = original_df.select(
+            [pl.col(col).unique().implode() for col in categorical_columns]
+        ).row(0)
+        new_row = new_df.select(
+            [pl.col(col).unique().implode() for col in categorical_columns]
+        ).row(0)
+        original_uniques = dict(zip(categorical_columns, original_row))
+        new_uniques = dict(zip(categorical_columns, new_row))
+
+    # Plain numpy-backed conversion: the profiler's reductions cannot handle
+    # pandas ArrowDtype columns.
+    profile_input = new_df.to_pandas()
+    full_profile_df = run_ydata_profiling_report(
+        profile_input,
+        type_schema,
+        sortby=_profile_sortby(profile_input, columns_config.time_column),
+    )
+    if not full_profile_df.empty:
+        full_profile_df = full_profile_df.set_index('column_name')
+
+    rows = []
+    for column_name in columns:
+        result = {'column_name': column_name}
+        column_type = type_schema[column_name]
+
+        if column_type == "timeseries":
+            combined = np.concatenate([
+                original_df.get_column(column_name).to_numpy(),
+                new_df.get_column(column_name).to_numpy(),
+            ]).astype(np.float32, copy=False)
+            result.update(analyze_trend_values(combined, columns_config.period))
+
+        elif column_type == "categorical":
+            seen = set(original_uniques[column_name])
+            new_entries = [value for value in new_uniques[column_name] if value not in seen]
+            if new_entries:
+                result['new_values'] = new_entries
+
+        if column_name in full_profile_df.index:
+            result.update(full_profile_df.loc[column_name].to_dict())
+        rows.append(result)
+
+    return pd.DataFrame(rows)
 
 def process_columns(
     original_df: Union[pd.DataFrame, ColumnarDataFrame],
@@ -68,23 +245,73 @@ def process_columns(
     pd.DataFrame
         A DataFrame containing the accumulated results for all columns.
     """
-    final_report_df = pd.DataFrame()
-
-    for column_name in original_df.columns:
-        if column_name == columns_config.time_column:
-            continue
-        column_config = ColumnAnalysisConfig(
-            column_name=column_name,
-            time_column=columns_config.time_column,
-            period=columns_config.period,
-            type_schema=columns_config.type_schema
+    # Only frames from an already-imported polars can be polars frames, so the
+    # check never forces the import for pandas-only callers.
+    polars = sys.modules.get('polars')
+    if polars is not None and isinstance(original_df, polars.DataFrame):
+        return _process_columns_polars(original_df, new_df, columns_config)
+
+    # Profile the full frame once: ydata-profiling pays a fixed scaffolding
+    # cost per invocation, so one batched run beats a run per column.
+    full_profile_df = None
+    if isinstance(new_df, pd.DataFrame):
+        full_profile_df = run_ydata_profiling_report(
+            new_df,
+            columns_config.type_schema,
+            sortby=_profile_sortby(new_df, columns_config.time_column),
         )
-        if isinstance(original_df, ColumnarDataFrame):
-            original_column_df = original_df.load_column(column_name)
-            new_column_df = new_df.load_column(column_name)
-            column_report_df = process_column(original_column_df, new_column_df, column_config)
-        else:
-            column_report_df = process_column(original_df[[columns_config.time_column, column_name]], new_df[[columns_config.time_column, column_name]], column_config)
-        final_report_df = pd.concat([final_report_df, column_report_df], ignore_index=True)
+        if not full_profile_df.empty:
+            full_profile_df = full_profile_df.set_index('column_name')
+
+    futures = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for column_name in original_df.columns:
+            if column_name == columns_config.time_column:
+                continue
+            profile_row = None
+            if full_profile_df is not None:
+                if column_name in full_profile_df.index:
+                    profile_row = full_profile_df.loc[column_name]
+                else:
+                    profile_row = pd.Series(dtype=object)
+            column_config = ColumnAnalysisConfig(
+                column_name=column_name,
+                time_column=columns_config.time_column,
+                period=columns_config.period,
+                type_schema=columns_config.type_schema
+            )
+            if isinstance(original_df, ColumnarDataFrame):
+                # Decided per frame, not per pair: a resident side (which has
+                # no on-disk source) hands its column slice to the worker
+                # directly, a spilled side ships its source triple.
+                original_source = (
+                    original_df.load_column(column_name)
+                    if original_df.memory_resident
+                    else original_df.column_source(column_name)
+                )
+                new_source = (
+                    new_df.load_column(column_name)
+                    if new_df.memory_resident
+                    else new_df.column_source(column_name)
+                )
+                futures.append(executor.submit(
+                    _process_column_from_sources,
+                    original_source,
+                    new_source,
+                    column_config
+                ))
+            else:
+                # The analysis functions only ever touch the analyzed column
+                # (the trend path works on raw value arrays), so a single-column
+                # slice per task avoids building two-column frames every
+                # iteration.
+                futures.append(executor.submit(
+                    process_column,
+                    original_df[[column_name]],
+                    new_df[[column_name]],
+                    column_config,
+                    profile_row
+                ))
+        final_report_df = pd.DataFrame([future.result() for future in futures])
     return final_report_df
 
@@ -1,21 +1,20 @@
 import pandas as pd
-from typing import Union
+from typing import TYPE_CHECKING, Union
 from onedatareport.analysis.column import process_columns
 from onedatareport.config.analysis import ColumnsAnalysisConfig
 from onedatareport.config.data import DataConfig
 from onedatareport.data_handling.factory import DataHandlerFactory
-import polars as pl
-from pyspark.sql import DataFrame as PySparkDataFrame
-from typing import Union
-import pandas as pd
+from onedatareport.utils.data import read_and_prepare_data
 
-from utils.data import read_and_prepare_data
+if TYPE_CHECKING:
+    import polars as pl
+    from pyspark.sql import DataFrame as PySparkDataFrame
 
 def save_final_report(
-    final_report_df: Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame],
+    final_report_df: Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame'],
     config: DataConfig,
     **kwargs
-) -> Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame]:
+) -> Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame']:
     """
     Save the final report according to the specified format and path.
 
@@ -45,7 +44,7 @@ def generate_report(
     columns_config: ColumnsAnalysisConfig,
     report_config: DataConfig,
     **kwargs
-) -> Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame]:
+) -> Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame']:
     """
     Generates a final report by processing one column at a time, saving intermediate results, and
     outputting the final report in the specified format.
@@ -68,9 +67,8 @@ def generate_report(
     Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame]
         A DataFrame containing the full report with results for all columns.
     """
-    # Step 1: Read and prepare data
-    original_df = read_and_prepare_data(original_config, **kwargs)
-    new_df = read_and_prepare_data(new_config, **kwargs)
+    # Step 1: Read and prepare data (both datasets load concurrently)
+    original_df, new_df = read_and_prepare_data(original_config, new_config, **kwargs)
 
     # Step 2: Process columns and generate report DataFrame
     final_report_df = process_columns(original_df, new_df, columns_config)
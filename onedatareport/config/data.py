@@ -1,7 +1,9 @@
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
-from pyspark.sql import SparkSession
+
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
 
 
 @dataclass
@@ -20,8 +22,13 @@ class DataConfig:
         This can be a local path, S3 URI, or HTTP URL.
     spark : Optional[SparkSession], optional
         The Spark session to be used if the data format is 'pyspark'.
+    lazy : bool, optional
+        If True and the data format is 'polars', read through the lazy scan
+        path (scan_csv/scan_parquet) so projections and filters are pushed
+        down before any data is materialized. Defaults to False.
     """
     data_format: str
     data_type: str
     path: Optional[str] = None
-    spark: Optional[SparkSession] = None
+    spark: Optional['SparkSession'] = None
+    lazy: bool = False
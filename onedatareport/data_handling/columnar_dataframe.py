@@ -1,46 +1,163 @@
-import pandas as pd
 import os
+import sys
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import tempfile
 import shutil
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Frames smaller than this stay fully resident in memory: below it, the spill
+# round-trip costs more than simply keeping every column around.
+_MEMORY_RESIDENT_THRESHOLD = 512 * 1024 * 1024
+
+def _estimated_size(df: Union[pd.DataFrame, 'pl.DataFrame']) -> int:
+    """
+    Estimate the in-memory size of a DataFrame in bytes.
+
+    Parameters
+    ----------
+    df : Union[pd.DataFrame, pl.DataFrame]
+        The DataFrame to size up.
+
+    Returns
+    -------
+    int
+        The estimated size in bytes; unknown frame types (e.g. pyspark) report
+        the spill threshold so they are always spilled.
+    """
+    if isinstance(df, pd.DataFrame):
+        return int(df.memory_usage(deep=True).sum())
+    polars = sys.modules.get('polars')
+    if polars is not None and isinstance(df, polars.DataFrame):
+        return df.estimated_size()
+    return _MEMORY_RESIDENT_THRESHOLD
+
+def read_column_source(source: Tuple[str, str, str]) -> pd.DataFrame:
+    """
+    Read the column described by a `ColumnarDataFrame.column_source` triple.
+
+    Parameters
+    ----------
+    source : Tuple[str, str, str]
+        A (file_path, column_name, file_format) triple as returned by
+        `column_source`, where file_format is 'feather' or 'parquet'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The column as a numpy-backed pandas DataFrame. Workers feed these
+        frames straight into profiling, whose reductions do not support
+        pandas ArrowDtype columns.
+    """
+    path, column_name, file_format = source
+    if file_format == 'parquet':
+        table = pq.read_table(path, columns=[column_name], use_threads=True)
+    else:
+        table = feather.read_table(path, columns=[column_name], memory_map=True)
+    return table.to_pandas()
 
 class ColumnarDataFrame:
-    def __init__(self, df: pd.DataFrame, data_type: str):
+    def __init__(self, df: Union[pd.DataFrame, 'pl.DataFrame'], data_type: str):
         """
         Initialize the ColumnarDataFrame with the original data.
 
         Parameters
         ----------
-        df : pd.DataFrame
+        df : Union[pd.DataFrame, pl.DataFrame]
             The original DataFrame containing the data.
         data_type : str
             The type of the original data ('pandas', 'polars', 'pyspark').
         """
         self.data_type = data_type
-        self.temp_dir = tempfile.mkdtemp()
-        self.columns = df.columns if self.data_type == 'pyspark' else df.columns.tolist()
+        self._parquet_path = None
+        self.columns = df.columns.tolist() if self.data_type == 'pandas' else list(df.columns)
         self.current_column = None
         self.current_column_name = None
-        self.store_data(df)
+        self.memory_resident = _estimated_size(df) < _MEMORY_RESIDENT_THRESHOLD
+        if self.memory_resident:
+            # Small enough to keep resident: skip the disk spill entirely.
+            self.temp_dir = None
+            self._data_path = None
+            if self.data_type == 'polars':
+                self._columns_in_memory = {
+                    col: df.select(col).to_pandas(use_pyarrow_extension_array=True)
+                    for col in self.columns
+                }
+            else:
+                self._columns_in_memory = {col: df[[col]] for col in self.columns}
+        else:
+            self.temp_dir = tempfile.mkdtemp()
+            self._data_path = os.path.join(self.temp_dir, "data.arrow")
+            self.store_data(df)
 
-    def store_data(self, df: pd.DataFrame):
+    @classmethod
+    def from_parquet(cls, path: str) -> 'ColumnarDataFrame':
         """
-        Stores each column of the DataFrame as a separate file on disk.
+        Build a ColumnarDataFrame backed directly by an existing Parquet file.
+
+        No data is materialized or re-written: columns are read on demand from
+        the Parquet source with projection pushdown, so only the pages of the
+        requested column ever touch memory.
 
         Parameters
         ----------
-        df : pd.DataFrame
+        path : str
+            The path of the Parquet file backing the data.
+
+        Returns
+        -------
+        ColumnarDataFrame
+            A ColumnarDataFrame reading columns lazily from the Parquet file.
+        """
+        instance = cls.__new__(cls)
+        instance.data_type = 'pandas'
+        instance.temp_dir = None
+        instance._parquet_path = path
+        instance._data_path = None
+        instance.memory_resident = False
+        instance.columns = pq.read_schema(path).names
+        instance.current_column = None
+        instance.current_column_name = None
+        return instance
+
+    def store_data(self, df: Union[pd.DataFrame, 'pl.DataFrame']):
+        """
+        Stores the DataFrame as a single uncompressed Arrow IPC (Feather) file on disk.
+
+        One file instead of one per column keeps filesystem metadata overhead
+        (inodes, open/close syscalls per column switch) constant regardless of
+        table width; `load_column` memory-maps the file and projects out a
+        single column at a time. Polars frames are converted straight to Arrow
+        without a pandas round-trip.
+
+        Parameters
+        ----------
+        df : Union[pd.DataFrame, pl.DataFrame]
             The DataFrame containing the data to store.
         """
-        for col in self.columns:
-            col_path = os.path.join(self.temp_dir, f"{col}.pkl")
-            df[[col]].to_pickle(col_path)
+        if self.data_type == 'polars':
+            # Polars frames are already Arrow-backed; the conversion is zero-copy.
+            table = df.to_arrow()
+        else:
+            # Converting pandas columns to Arrow releases the GIL, so a thread
+            # pool overlaps the per-column conversions before the single write.
+            with ThreadPoolExecutor(max_workers=min(32, len(self.columns))) as executor:
+                arrays = list(executor.map(lambda col: pa.array(df[col]), self.columns))
+            table = pa.Table.from_arrays(arrays, names=[str(col) for col in self.columns])
+        feather.write_feather(table, self._data_path, compression='uncompressed')
 
     def load_column(self, column_name: str) -> pd.DataFrame:
         """
-        Load a single column into memory as a pandas DataFrame, and store the currently
-        loaded column back to disk.
+        Load a single column into memory as a pandas DataFrame.
+
+        Columns are never mutated after `store_data`, so the previously loaded
+        column is simply released — the data on disk is already a correct copy.
 
         Parameters
         ----------
@@ -52,18 +169,54 @@ class ColumnarDataFrame:
         pd.DataFrame
             The specified column as a pandas DataFrame.
         """
-        if self.current_column_name is not None and self.current_column_name != column_name:
-            # Store the currently in-memory column back to disk
-            col_path = os.path.join(self.temp_dir, f"{self.current_column_name}.pkl")
-            self.current_column.to_pickle(col_path)
+        if self.memory_resident:
+            self.current_column = self._columns_in_memory[column_name]
+            self.current_column_name = column_name
+            return self.current_column
 
-        # Load the requested column from disk
-        col_path = os.path.join(self.temp_dir, f"{column_name}.pkl")
-        self.current_column = pd.read_pickle(col_path)
+        if self._parquet_path is not None:
+            # Parquet-backed: project just the requested column out of the source file.
+            table = pq.read_table(self._parquet_path, columns=[column_name], use_threads=True)
+        else:
+            # Project the column out of the memory-mapped IPC file.
+            table = feather.read_table(self._data_path, columns=[column_name], memory_map=True)
+        # Numpy-backed conversion: loaded columns go straight into profiling,
+        # whose reductions do not support pandas ArrowDtype columns.
+        self.current_column = table.to_pandas()
         self.current_column_name = column_name
 
         return self.current_column
 
+    def column_source(self, column_name: str) -> Tuple[str, str, str]:
+        """
+        Describe where a column lives on disk so worker processes can read it.
+
+        Parameters
+        ----------
+        column_name : str
+            The name of the column.
+
+        Returns
+        -------
+        Tuple[str, str, str]
+            A (file_path, column_name, file_format) triple pointing at the
+            shared Parquet source or the spilled Arrow IPC file.
+
+        Raises
+        ------
+        ValueError
+            If the frame is memory-resident and therefore has no on-disk
+            source; use `load_column` instead.
+        """
+        if self._parquet_path is not None:
+            return self._parquet_path, column_name, 'parquet'
+        if self._data_path is None:
+            raise ValueError(
+                "Memory-resident ColumnarDataFrame has no on-disk column source; "
+                "use load_column instead."
+            )
+        return self._data_path, column_name, 'feather'
+
     def __iter__(self):
         """
         Iterator over the columns of the DataFrame.
@@ -86,4 +239,5 @@ class ColumnarDataFrame:
         """
         Cleanup the temporary files when the object is deleted.
         """
-        shutil.rmtree(self.temp_dir)
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir)
@@ -1,12 +1,42 @@
 
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
 from onedatareport.data_handling.handlers.pandas import PandasCSVHandler, PandasParquetHandler
 from onedatareport.data_handling.handlers.polars import PolarsCSVHandler, PolarsParquetHandler
 from onedatareport.data_handling.handlers.pyspark import PySparkCSVHandler, PySparkDeltaHandler, PySparkParquetHandler
-from onedatareport.data_handling.handlers.remote import HTTPDataHandler
+from onedatareport.data_handling.handlers.remote import HTTPDataHandler, RemoteDataHandler
 from onedatareport.data_handling.handlers.base import DataHandler
 from onedatareport.config.data import DataConfig
 
 
+# Stateless handlers are constructed once at import time and shared across
+# calls; only the PySpark handlers carry per-call state (the Spark session).
+_STATELESS_HANDLERS = {
+    ('pandas', 'csv'): PandasCSVHandler(),
+    ('pandas', 'parquet'): PandasParquetHandler(),
+    ('polars', 'csv'): PolarsCSVHandler(),
+    ('polars', 'parquet'): PolarsParquetHandler(),
+}
+_HTTP_HANDLER = HTTPDataHandler()
+
+# Scheme -> handler kind: the single source of truth for classifying a path
+# as remote or local. Classification is one dict lookup on the parsed scheme,
+# and adding a new remote scheme (s3, gs, abfs) is a one-line table entry.
+_SCHEME_HANDLERS = {
+    'http': 'remote',
+    'https': 'remote',
+    '': 'local',
+    'file': 'local',
+}
+
+def _is_remote(path: Optional[str]) -> bool:
+    """Classify a path as remote through the scheme table."""
+    if not path:
+        return False
+    return _SCHEME_HANDLERS.get(urlparse(path).scheme) == 'remote'
+
+
 class DataHandlerFactory:
     """
     Factory class to create appropriate DataHandler instances based on the DataConfig.
@@ -15,8 +45,10 @@ class DataHandlerFactory:
     -------
     get_handler(config: DataConfig) -> DataHandler
         Static method to return a DataHandler instance based on the configuration provided.
+    get_handlers(config: DataConfig) -> Tuple[Optional[RemoteDataHandler], DataHandler]
+        Static method to resolve the remote and reader handlers in one lookup.
     """
-    
+
     @staticmethod
     def get_handler(config: DataConfig) -> DataHandler:
         """
@@ -30,7 +62,7 @@ class DataHandlerFactory:
         Returns
         -------
         DataHandler
-            An instance of a subclass of DataHandler that matches the data format and type specified 
+            An instance of a subclass of DataHandler that matches the data format and type specified
             in the configuration.
 
         Raises
@@ -38,23 +70,48 @@ class DataHandlerFactory:
         ValueError
             If no suitable handler is found for the given data format and type.
         """
-        if config.path and (config.path.startswith('http://') or config.path.startswith('https://')):
-            return HTTPDataHandler()
-        if config.data_format == 'pandas':
-            if config.data_type == 'csv':
-                return PandasCSVHandler()
-            elif config.data_type == 'parquet':
-                return PandasParquetHandler()
-        elif config.data_format == 'polars':
-            if config.data_type == 'csv':
-                return PolarsCSVHandler()
-            elif config.data_type == 'parquet':
-                return PolarsParquetHandler()
-        elif config.data_format == 'pyspark':
+        if _is_remote(config.path):
+            return _HTTP_HANDLER
+        return DataHandlerFactory._get_reader(config)
+
+    @staticmethod
+    def get_handlers(config: DataConfig) -> Tuple[Optional[RemoteDataHandler], DataHandler]:
+        """
+        Resolve the remote and reader handlers for a configuration in one lookup.
+
+        The reader is resolved from the data format and type regardless of
+        whether the path is remote, so callers that download first can read
+        the local copy without a second factory call.
+
+        Parameters
+        ----------
+        config : DataConfig
+            The DataConfig object containing the format, type, and path of the data.
+
+        Returns
+        -------
+        Tuple[Optional[RemoteDataHandler], DataHandler]
+            The remote handler (None for local sources) and the reader handler.
+
+        Raises
+        ------
+        ValueError
+            If no suitable reader is found for the given data format and type.
+        """
+        remote_handler = _HTTP_HANDLER if _is_remote(config.path) else None
+        return remote_handler, DataHandlerFactory._get_reader(config)
+
+    @staticmethod
+    def _get_reader(config: DataConfig) -> DataHandler:
+        if config.data_format == 'pyspark':
             if config.data_type == 'csv':
                 return PySparkCSVHandler(config.spark)
             elif config.data_type == 'parquet':
                 return PySparkParquetHandler(config.spark)
             elif config.data_type == 'delta':
                 return PySparkDeltaHandler(config.spark)
+        else:
+            handler = _STATELESS_HANDLERS.get((config.data_format, config.data_type))
+            if handler is not None:
+                return handler
         raise ValueError(f"No handler found for format: {config.data_format}, type: {config.data_type}")
\ No newline at end of file
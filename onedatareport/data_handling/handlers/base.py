@@ -1,8 +1,10 @@
 import pandas as pd
-from typing import Union
-import polars as pl
-from pyspark.sql import DataFrame as PySparkDataFrame
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    import polars as pl
+    from pyspark.sql import DataFrame as PySparkDataFrame
 
 class DataHandler(ABC):
     """
@@ -18,7 +20,7 @@ class DataHandler(ABC):
     """
     
     @abstractmethod
-    def read(self, path: str, **kwargs) -> Union[pd.DataFrame, pl.DataFrame, 'PySparkDataFrame', 'ColumnarDataFrame']:
+    def read(self, path: str, **kwargs) -> Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame', 'ColumnarDataFrame']:
         """
         Read data from the specified path.
 
@@ -37,7 +39,7 @@ class DataHandler(ABC):
         pass
 
     @abstractmethod
-    def write(self, df: Union[pd.DataFrame, pl.DataFrame, 'PySparkDataFrame'], path: str, **kwargs):
+    def write(self, df: Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame'], path: str, **kwargs):
         """
         Write data to the specified path.
 
@@ -1,5 +1,7 @@
 import pandas as pd
+from typing import Union
 
+from onedatareport.data_handling.columnar_dataframe import ColumnarDataFrame
 from onedatareport.data_handling.handlers.base import DataHandler
 
 class PandasCSVHandler(DataHandler):
@@ -29,8 +31,10 @@ class PandasCSVHandler(DataHandler):
         Returns
         -------
         pd.DataFrame
-            The data read from the CSV file.
+            The data read from the CSV file, with Arrow-backed dtypes unless
+            the caller overrides `dtype_backend`.
         """
+        kwargs.setdefault('dtype_backend', 'pyarrow')
         return pd.read_csv(path, **kwargs)
 
     def write(self, df: pd.DataFrame, path: str, **kwargs):
@@ -62,7 +66,7 @@ class PandasParquetHandler(DataHandler):
         Writes a Pandas DataFrame to a Parquet file.
     """
     
-    def read(self, path: str, **kwargs) -> pd.DataFrame:
+    def read(self, path: str, columnar: bool = False, **kwargs) -> Union[pd.DataFrame, ColumnarDataFrame]:
         """
         Reads a Parquet file into a Pandas DataFrame.
 
@@ -70,14 +74,22 @@ class PandasParquetHandler(DataHandler):
         ----------
         path : str
             The file path of the Parquet file to be read.
+        columnar : bool, optional
+            If True, return a ColumnarDataFrame backed by the Parquet file so
+            that columns are read on demand with projection pushdown instead of
+            materializing the full table, by default False.
         **kwargs : dict
             Additional keyword arguments to pass to `pandas.read_parquet`.
 
         Returns
         -------
-        pd.DataFrame
-            The data read from the Parquet file.
+        Union[pd.DataFrame, ColumnarDataFrame]
+            The data read from the Parquet file, with Arrow-backed dtypes
+            unless the caller overrides `dtype_backend`.
         """
+        if columnar:
+            return ColumnarDataFrame.from_parquet(path)
+        kwargs.setdefault('dtype_backend', 'pyarrow')
         return pd.read_parquet(path, **kwargs)
 
     def write(self, df: pd.DataFrame, path: str, **kwargs):
@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from onedatareport.data_handling.handlers.base import DataHandler
-import polars as pl
+
+if TYPE_CHECKING:
+    import polars as pl
 
 class PolarsCSVHandler(DataHandler):
     """
@@ -14,7 +18,7 @@ class PolarsCSVHandler(DataHandler):
         Writes a Polars DataFrame to a CSV file.
     """
     
-    def read(self, path: str, **kwargs) -> pl.DataFrame:
+    def read(self, path: str, **kwargs) -> 'pl.DataFrame':
         """
         Reads a CSV file into a Polars DataFrame.
 
@@ -30,9 +34,10 @@ class PolarsCSVHandler(DataHandler):
         pl.DataFrame
             The data read from the CSV file.
         """
+        import polars as pl
         return pl.read_csv(path, **kwargs)
 
-    def write(self, df: pl.DataFrame, path: str, **kwargs):
+    def write(self, df: 'pl.DataFrame', path: str, **kwargs):
         """
         Writes a Polars DataFrame to a CSV file.
 
@@ -61,25 +66,39 @@ class PolarsParquetHandler(DataHandler):
         Writes a Polars DataFrame to a Parquet file.
     """
     
-    def read(self, path: str, **kwargs) -> pl.DataFrame:
+    def read(self, path: str, **kwargs) -> 'pl.DataFrame':
         """
         Reads a Parquet file into a Polars DataFrame.
 
+        The file goes through a lazy scan collected with the streaming engine,
+        so the read proceeds in chunks instead of materializing the full
+        decompressed table at once.
+
         Parameters
         ----------
         path : str
             The file path of the Parquet file to be read.
+        columns : list of str, optional
+            Columns to read; projected into the scan so the other columns are
+            never decoded.
         **kwargs : dict
-            Additional keyword arguments to pass to `polars.read_parquet`.
+            Additional keyword arguments to pass to `polars.scan_parquet`.
 
         Returns
         -------
         pl.DataFrame
             The data read from the Parquet file.
         """
-        return pl.read_parquet(path, **kwargs)
+        import polars as pl
+        # scan_parquet has no `columns` argument; keep the read_parquet
+        # contract by turning it into a projection on the scan.
+        columns = kwargs.pop('columns', None)
+        lazy_frame = pl.scan_parquet(path, **kwargs)
+        if columns is not None:
+            lazy_frame = lazy_frame.select(columns)
+        return lazy_frame.collect(engine='streaming')
 
-    def write(self, df: pl.DataFrame, path: str, **kwargs):
+    def write(self, df: 'pl.DataFrame', path: str, **kwargs):
         """
         Writes a Polars DataFrame to a Parquet file.
 
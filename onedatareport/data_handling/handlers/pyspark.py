@@ -1,8 +1,11 @@
 
-from pyspark.sql import DataFrame as PySparkDataFrame
+from typing import TYPE_CHECKING
 
 from onedatareport.data_handling.handlers.base import DataHandler
 
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame as PySparkDataFrame
+
 
 class PySparkCSVHandler(DataHandler):
     """
@@ -1,49 +1,104 @@
+import sys
 import pandas as pd
-from typing import Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from onedatareport.data_handling.columnar_dataframe import ColumnarDataFrame
 from onedatareport.data_handling.factory import DataHandlerFactory
 from onedatareport.config.data import DataConfig
-import polars as pl
-from pyspark.sql import DataFrame as PySparkDataFrame
-from typing import Union
-import pandas as pd
 
-def read_data(config: DataConfig, **kwargs) -> Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame, 'ColumnarDataFrame']:
+if TYPE_CHECKING:
+    import polars as pl
+    from pyspark.sql import DataFrame as PySparkDataFrame
+
+def read_data(config: DataConfig, **kwargs) -> Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame', 'PySparkDataFrame', 'ColumnarDataFrame']:
     """
     Reads data based on the DataConfig object and returns it in the specified format.
 
     Parameters
     ----------
     config : DataConfig
-        The DataConfig object containing format, data_type, and path.
+        The DataConfig object containing format, data_type, and path. When
+        `config.lazy` is set on a polars config, a LazyFrame is returned so
+        callers can push projections and filters into the scan before
+        collecting.
 
     **kwargs :
         Additional keyword arguments to pass to the read functions.
 
     Returns
     -------
-    Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame, 'ColumnarDataFrame']
+    Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, PySparkDataFrame, 'ColumnarDataFrame']
         The data read from the source in the specified format.
     """
-    if config.path and (config.path.startswith('http://') or config.path.startswith('https://')):
-        remote_handler = DataHandlerFactory.get_handler(config)
+    remote_handler, handler = DataHandlerFactory.get_handlers(config)
+    if remote_handler is not None:
         source_path = remote_handler.download(config.path)
     else:
         source_path = config.path
 
-    handler = DataHandlerFactory.get_handler(config)
+    if config.lazy and config.data_format == 'polars':
+        import polars as pl
+        if config.data_type == 'csv':
+            return pl.scan_csv(source_path, **kwargs)
+        elif config.data_type == 'parquet':
+            return pl.scan_parquet(source_path, **kwargs)
+
     return handler.read(source_path, **kwargs)
 
+def _collect_if_lazy(
+    df: Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame', 'PySparkDataFrame', 'ColumnarDataFrame'],
+    columns: Optional[List[str]] = None
+) -> Union[pd.DataFrame, 'pl.DataFrame', 'PySparkDataFrame', 'ColumnarDataFrame']:
+    """
+    Collect a polars LazyFrame, projecting to the requested columns first.
+
+    Parameters
+    ----------
+    df : Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, PySparkDataFrame, 'ColumnarDataFrame']
+        The frame returned by `read_data`; non-lazy frames pass through as-is.
+    columns : Optional[List[str]], optional
+        The columns to project into the scan before collecting, by default None.
+
+    Returns
+    -------
+    Union[pd.DataFrame, pl.DataFrame, PySparkDataFrame, 'ColumnarDataFrame']
+        The materialized frame.
+    """
+    polars = sys.modules.get('polars')
+    if polars is not None and isinstance(df, polars.LazyFrame):
+        if columns is not None:
+            df = df.select(columns)
+        return df.collect(engine='streaming')
+    return df
+
 def read_and_prepare_data(
     original_config: DataConfig,
     new_config: DataConfig,
+    columns: Optional[List[str]] = None,
     **kwargs
 ) -> Tuple[Union[pd.DataFrame, ColumnarDataFrame], Union[pd.DataFrame, ColumnarDataFrame]]:
     """
     Read and prepare original and new data according to the specified formats.
 
+    The two datasets are independent, so they are read concurrently: downloads
+    and the C/Rust parsing layers release the GIL, overlapping network latency
+    and parse time across the pair. Lazy polars configs are collected here at
+    the boundary, with `columns` (e.g. the keys of the analysis type schema)
+    pushed into the scan so unused columns are never parsed.
+
+    When both configs describe the same source, the data is downloaded and
+    parsed once and the same frame is returned for both sides; downstream
+    analysis only reads from the frames, so sharing is safe.
+
     Returns the prepared dataframes for further processing.
     """
-    original_df = read_data(original_config, **kwargs)
-    new_df = read_data(new_config, **kwargs)
-    return original_df, new_df
+    if original_config == new_config:
+        df = _collect_if_lazy(read_data(original_config, **kwargs), columns)
+        return df, df
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        original_future = executor.submit(read_data, original_config, **kwargs)
+        new_future = executor.submit(read_data, new_config, **kwargs)
+        original_df = _collect_if_lazy(original_future.result(), columns)
+        new_df = _collect_if_lazy(new_future.result(), columns)
+        return original_df, new_df
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from onedatareport.utils.profiling import _to_numpy_backed, run_ydata_profiling_report
+
+
+def _arrow_backed_frame() -> pd.DataFrame:
+    df = pd.DataFrame({
+        "value": np.linspace(0.0, 10.0, 50),
+        "category": ["a", "b"] * 25,
+    })
+    return df.convert_dtypes(dtype_backend="pyarrow")
+
+
+def test_to_numpy_backed_drops_arrow_dtypes():
+    converted = _to_numpy_backed(_arrow_backed_frame())
+    assert not any(isinstance(dtype, pd.ArrowDtype) for dtype in converted.dtypes)
+
+
+def test_profiles_arrow_backed_frame():
+    # The profiler's reductions reject ArrowDtype columns; this exercises the
+    # conversion on the exact path the Arrow-defaulting readers feed.
+    df = _arrow_backed_frame()
+    result = run_ydata_profiling_report(
+        df, {"value": "numeric", "category": "categorical"}
+    )
+    assert not result.empty
+    assert set(result["column_name"]) == {"value", "category"}